@@ -3,10 +3,12 @@ from tkinter import ttk
 from enum import Enum
 from copy import deepcopy
 from threading import Thread
+from heapq import heapify, heappop, heappush
 import random
 import time
 import math
 import re
+import numpy as np
 
 
 class SimState(Enum):
@@ -27,12 +29,23 @@ class Algorithm(Enum):
     MEJ_HUECO = 2
 
 
+class PageAlgorithm(Enum):
+    FIFO = 1
+    LRU = 2
+    CLOCK = 3
+    OPT = 4
+
+
 class AppExceptionTypes(Enum):
     WRONG_PROCESS_INPUT_FORMAT = 1
     TOO_FEW_PROCESSES = 2
     INVALID_REQUIRED_MEMORY_AMOUNT = 3
     WRONG_DATA_TYPE = 4
     SIMULATION_ERROR = 5
+    WRONG_REFERENCE_INPUT_FORMAT = 6
+    INVALID_PAGE_REFERENCE = 7
+    DUPLICATE_PROCESS_NAME = 8
+    INVALID_FRAMES_AMOUNT = 9
 
 
 class AppException(Exception):
@@ -45,9 +58,17 @@ class AppException(Exception):
         elif exc_type == exc_type.INVALID_REQUIRED_MEMORY_AMOUNT:
             print(f"err -> La memoria requerida debe contenerse en (100, {Simulation.TOTAL_MEM}]")
         elif exc_type == exc_type.WRONG_DATA_TYPE:
-            print(f"err -> Se ha introducido un valor erróneo")
+            print("err -> Se ha introducido un valor erróneo" + (" en '" + str(text) + "'" if text else ""))
         elif exc_type == exc_type.SIMULATION_ERROR:
             print(f"err -> Error en la simulación")
+        elif exc_type == exc_type.WRONG_REFERENCE_INPUT_FORMAT:
+            print("err -> '" + str(text) + "' tiene mal formato. Debería ser <process> <page>")
+        elif exc_type == exc_type.INVALID_PAGE_REFERENCE:
+            print("err -> La referencia '" + str(text) + "' no corresponde a ninguna página de un proceso")
+        elif exc_type == exc_type.DUPLICATE_PROCESS_NAME:
+            print("err -> Hay varios procesos llamados '" + str(text) + "'")
+        elif exc_type == exc_type.INVALID_FRAMES_AMOUNT:
+            print("err -> El número de marcos debe ser al menos 1, no " + str(text))
 
 
 class Process():
@@ -77,6 +98,9 @@ class Process():
     def get_req_mem(self):
         return self._req_mem
 
+    def get_duration(self):
+        return self._duration
+
     def is_waiting(self):
         return self._prcs_state == PrcsState.WAITING
 
@@ -319,6 +343,487 @@ class Simulation():
         self._inst += 1
 
 
+class PageTable():
+    #
+    # Tabla de páginas de un proceso. Es una vista sobre la tabla global de la simulación
+    # paginada: cada entrada guarda el marco que ocupa la página o -1 si no está cargada
+    #
+    def __init__(self, prcs: Process, first_vpage: int, frames: np.ndarray):
+        self._prcs = prcs
+        self._first_vpage = first_vpage
+        self._frames = frames
+        self._faults = 0
+
+    def get_prcs(self):
+        return self._prcs
+
+    def get_first_vpage(self):
+        return self._first_vpage
+
+    def get_pages_amt(self):
+        return len(self._frames)
+
+    def get_frame(self, page: int):
+        return int(self._frames[page])
+
+    def get_frames(self):
+        return self._frames
+
+    def get_faults(self):
+        return self._faults
+
+    def set_faults(self, faults: int):
+        self._faults = faults
+
+
+class PagingResult():
+    #
+    # Resultado de evaluar un algoritmo de reemplazo con un número de marcos. Las cuentas
+    # por proceso siguen el orden de las tablas de páginas de la simulación
+    #
+    def __init__(self, algo: PageAlgorithm, frames_amt: int, prcs_refs: list, prcs_faults: list):
+        self._algo = algo
+        self._frames_amt = frames_amt
+        self._prcs_refs = prcs_refs
+        self._prcs_faults = prcs_faults
+
+    def get_algo(self):
+        return self._algo
+
+    def get_frames_amt(self):
+        return self._frames_amt
+
+    def get_refs_amt(self):
+        return sum(self._prcs_refs)
+
+    def get_faults(self):
+        return sum(self._prcs_faults)
+
+    def get_fault_rate(self):
+        return self.get_faults() / self.get_refs_amt() if self.get_refs_amt() else 0.0
+
+    def get_prcs_refs(self):
+        return self._prcs_refs
+
+    def get_prcs_faults(self):
+        return self._prcs_faults
+
+    def get_prcs_fault_rate(self, idx: int):
+        return self._prcs_faults[idx] / self._prcs_refs[idx] if self._prcs_refs[idx] else 0.0
+
+
+class PagingSimulation():
+    #
+    # Simula la memoria virtual paginada: marcos de tamaño fijo compartidos por todos los
+    # procesos (reemplazo global) y una tabla de páginas por proceso.
+    # Las páginas de todos los procesos se numeran de forma consecutiva (página virtual
+    # global), así la cadena de referencias es un único array de enteros.
+    #
+    PAGE_SIZE = 100
+    FRAMES_AMT = Simulation.TOTAL_MEM // PAGE_SIZE
+    REFS_PER_INST = 100
+    JUMP_PROB = 0.05
+    MIN_BATCH = 64
+    MIN_HIT_RUN = 64
+    STACK_MAX_WORK = 32
+    DENSE_BLOCK = 4096
+
+    def __init__(self, processes: list, frames_amt: int = FRAMES_AMT):
+        if frames_amt < 1:
+            raise AppException(AppExceptionTypes.INVALID_FRAMES_AMOUNT, frames_amt)
+        pages_amt = [math.ceil(prcs.get_req_mem() / self.PAGE_SIZE) for prcs in processes]
+
+        self._frames_amt = frames_amt
+        self._first_vpage = np.concatenate(([0], np.cumsum(pages_amt, dtype=np.int64)))
+        self._vpage_prcs = np.repeat(np.arange(len(processes)), pages_amt)
+        self._vpage_frame = np.full(self._first_vpage[-1], -1, dtype=np.int64)
+        self._page_tables = [PageTable(prcs, int(self._first_vpage[idx]), self._vpage_frame[self._first_vpage[idx]:self._first_vpage[idx + 1]])
+                             for idx, prcs in enumerate(processes)]
+        self._refs = np.empty(0, dtype=np.int64)
+
+    def get_page_tables(self):
+        return self._page_tables
+
+    def get_frames_amt(self):
+        return self._frames_amt
+
+    def get_refs(self):
+        return self._refs
+
+    def get_refs_amt(self):
+        return len(self._refs)
+
+    def set_refs(self, refs: np.ndarray):
+        self._refs = np.asarray(refs, dtype=np.int64)
+
+    def make_rand_refs(self, refs_per_inst: int = REFS_PER_INST, seed: int = None):
+        #
+        # Genera una cadena de referencias sintética a partir de los procesos: cada proceso hace
+        # refs_per_inst referencias por instante mientras dura, recorriendo sus páginas con
+        # localidad (avanza, retrocede o se queda) y saltando de vez en cuando a una página aleatoria.
+        # En cada instante los procesos se turnan en orden aleatorio y cada uno hace sus referencias seguidas
+        #
+        rng = np.random.default_rng(seed)
+        times = []
+        turns = []
+        vpages = []
+        table: PageTable
+
+        for table in self._page_tables:
+            duration = table.get_prcs().get_duration()
+            amt = duration * refs_per_inst
+            steps = np.where(rng.random(amt) < self.JUMP_PROB, rng.integers(0, table.get_pages_amt(), amt), rng.integers(-1, 2, amt))
+            times.append(np.repeat(table.get_prcs().get_arrival() + np.arange(duration), refs_per_inst))
+            turns.append(np.repeat(rng.random(duration), refs_per_inst))
+            vpages.append(table.get_first_vpage() + np.cumsum(steps) % table.get_pages_amt())
+        if not times:
+            self._refs = np.empty(0, dtype=np.int64)
+            return
+        self._refs = np.concatenate(vpages).astype(np.int64)[np.lexsort((np.concatenate(turns), np.concatenate(times)))]
+
+    def read_refs_from_fl(self, filename: str):
+        #
+        # Lee la cadena de referencias de un archivo de texto. Cada línea es <process> <page>
+        #
+        try:
+            with open(filename, "r") as refs_fl:
+                lines = [line.split() for line in refs_fl if line.strip() and not line.lstrip().startswith("#")]
+        except UnicodeDecodeError:
+            raise AppException(AppExceptionTypes.WRONG_REFERENCE_INPUT_FORMAT, filename)
+        for line in lines:
+            if len(line) != 2:
+                raise AppException(AppExceptionTypes.WRONG_REFERENCE_INPUT_FORMAT, " ".join(line))
+        if not lines:
+            self._refs = np.empty(0, dtype=np.int64)
+            return
+        data = np.array(lines)
+        try:
+            pages = data[:, 1].astype(np.int64)
+        except (ValueError, OverflowError):
+            # Se busca la línea que falla para poder indicarla
+            for line in lines:
+                try:
+                    np.array(line[1]).astype(np.int64)
+                except (ValueError, OverflowError):
+                    raise AppException(AppExceptionTypes.WRONG_DATA_TYPE, " ".join(line))
+            raise
+
+        prcs_idx = {}
+        for idx, table in enumerate(self._page_tables):
+            prcs_idx.setdefault(str(table.get_prcs().get_name()), []).append(idx)
+        names, inv = np.unique(data[:, 0], return_inverse=True)
+        for name in names:
+            if name not in prcs_idx:
+                raise AppException(AppExceptionTypes.INVALID_PAGE_REFERENCE, name)
+            if len(prcs_idx[name]) > 1:
+                raise AppException(AppExceptionTypes.DUPLICATE_PROCESS_NAME, name)
+        prcs = np.array([prcs_idx[name][0] for name in names], dtype=np.int64)[inv.ravel()]
+        bad = np.flatnonzero((pages < 0) | (pages >= np.diff(self._first_vpage)[prcs]))
+        if len(bad):
+            raise AppException(AppExceptionTypes.INVALID_PAGE_REFERENCE, " ".join(lines[bad[0]]))
+        self._refs = self._first_vpage[prcs] + pages
+
+    def run(self, algo: PageAlgorithm):
+        #
+        # Evalúa un algoritmo de reemplazo con los marcos de la simulación. Las tablas de
+        # páginas quedan como están al acabar la cadena de referencias
+        #
+        r = self.collapse_refs(self._refs)
+        depths = None
+
+        if np.count_nonzero(np.bincount(r, minlength=len(self._vpage_frame))) <= self._frames_amt:
+            # Caben todas las páginas usadas: solo fallan las primeras referencias a cada una
+            first = np.sort(np.unique(r, return_index=True)[1])
+            self._vpage_frame.fill(-1)
+            self._vpage_frame[r[first]] = np.arange(len(first))
+            return self.make_result(algo, self._frames_amt, r[first])
+        if algo == PageAlgorithm.LRU or algo == PageAlgorithm.OPT:
+            # Con muchos marcos y muchos fallos recorrer la pila sale caro: LRU cuenta las distancias y OPT se simula
+            depths = self.stack_depths(r, algo, self._frames_amt, self.STACK_MAX_WORK * len(r))
+            if depths is None and algo == PageAlgorithm.LRU:
+                depths = self.lru_depths(r, self._frames_amt)
+        if depths is not None:
+            return self.make_result(algo, self._frames_amt, r[depths > self._frames_amt])
+        return self.make_result(algo, self._frames_amt, r[self.replay_faults(r, algo, self._frames_amt)])
+
+    def run_all(self):
+        return [self.run(algo) for algo in PageAlgorithm]
+
+    def run_all_frames(self, algo: PageAlgorithm):
+        #
+        # Evalúa un algoritmo con 1, 2, ..., frames_amt marcos. LRU y OPT son algoritmos de pila:
+        # una sola pasada da la profundidad de cada referencia y con ella los fallos para cualquier
+        # número de marcos. FIFO y CLOCK no lo son y se simulan una vez por cada número de marcos
+        #
+        r = self.collapse_refs(self._refs)
+        results = []
+
+        if algo == PageAlgorithm.LRU or algo == PageAlgorithm.OPT:
+            depths = self.stack_depths(r, algo, self._frames_amt, self.STACK_MAX_WORK * len(r))
+            if depths is None:
+                depths = self.lru_depths(r, self._frames_amt) if algo == PageAlgorithm.LRU else self.stack_depths(r, algo, self._frames_amt)
+            for frames_amt in range(1, self._frames_amt + 1):
+                results.append(self.make_result(algo, frames_amt, r[depths > frames_amt]))
+        else:
+            for frames_amt in range(1, self._frames_amt + 1):
+                results.append(self.make_result(algo, frames_amt, r[self.replay_faults(r, algo, frames_amt)]))
+        return results
+
+    def make_result(self, algo: PageAlgorithm, frames_amt: int, fault_vpages: np.ndarray):
+        prcs_amt = len(self._page_tables)
+        prcs_refs = np.bincount(self._vpage_prcs[self._refs], minlength=prcs_amt).tolist()
+        prcs_faults = np.bincount(self._vpage_prcs[fault_vpages], minlength=prcs_amt).tolist()
+
+        for table, faults in zip(self._page_tables, prcs_faults):
+            table.set_faults(faults)
+        return PagingResult(algo, frames_amt, prcs_refs, prcs_faults)
+
+    def lru_depths(self, r: np.ndarray, max_depth: int):
+        #
+        # Profundidad de cada referencia en la pila de LRU (max_depth + 1 si está más abajo o la página
+        # no se había usado). Con F marcos una referencia falla si su profundidad es mayor que F.
+        # La profundidad de la referencia i es el número de páginas distintas usadas desde su uso anterior
+        # prv[i] más uno: i - prv[i] menos las referencias intermedias que repiten página, que son las m < i
+        # con prv[m] > prv[i]. Ese conteo se hace para todas las referencias a la vez con una pasada por bit
+        # de prv, del más al menos significativo: en cada pasada las referencias cuyo prv coincide en los bits
+        # ya vistos están juntas y en orden, y cada una con el bit a 0 suma las anteriores de su grupo con el
+        # bit a 1. Son log2(n) pasadas y el coste no depende del número de marcos.
+        # Las tablas de páginas quedan con las max_depth páginas usadas más recientemente (el marco es el nivel)
+        #
+        n = len(r)
+        depths = np.full(n, max_depth + 1, dtype=np.int64)
+        self._vpage_frame.fill(-1)
+        if not n:
+            return depths
+        prv, nxt = self.prev_next_use(r)
+        pos = np.arange(n)
+        key = (prv + 1) << 32  # prv + 1 en los bits altos y el conteo en los bajos, para reordenarlos juntos
+        new = np.ones(n, dtype=bool)
+
+        for b in range(32 + (n - 1).bit_length() - 1, 31, -1):
+            bit = (key >> b) & 1
+            np.not_equal(key[1:] >> (b + 1), key[:-1] >> (b + 1), out=new[1:])
+            ones = np.cumsum(bit) - bit
+            key += (ones - np.maximum.accumulate(np.where(new, ones, 0))) * (1 - bit)
+            # Las del bit a 0 pasan delante de las del bit a 1 sin perder el orden
+            dst = np.where(bit == 1, n - ones[-1] - bit[-1] + ones, pos - ones)
+            ordered = np.empty_like(key)
+            ordered[dst] = key
+            key = ordered
+
+        used = key >= 1 << 32
+        idx = nxt[(key[used] >> 32) - 1]
+        depths[idx] = np.minimum(idx - prv[idx] - (key[used] & 0xFFFFFFFF), max_depth + 1)
+        last = np.flatnonzero(nxt == n)[::-1][:max_depth]
+        self._vpage_frame[r[last]] = np.arange(len(last))
+        return depths
+
+    def stack_depths(self, r: np.ndarray, algo: PageAlgorithm, max_depth: int, max_work: int = None):
+        #
+        # Profundidad de cada referencia en la pila de LRU u OPT (max_depth + 1 si está más abajo
+        # o la página no se había usado). Con F marcos una referencia falla si su profundidad es mayor que F.
+        # La pila se recorre nivel a nivel en vez de referencia a referencia: para el nivel k se
+        # tienen los instantes en los que una página baja hasta él (P) y qué página baja (V, guardada
+        # como su prioridad), y con un par de operaciones sobre esos arrays se obtiene lo que había
+        # en el nivel en cada uno de esos instantes, qué referencias aciertan ahí y qué baja al nivel k + 1.
+        # En LRU la prioridad es el último uso y lo que llega a un nivel siempre desplaza a lo que había.
+        # En OPT es el próximo uso y se queda en el nivel la página que se vuelva a usar antes.
+        # Cada nivel cuesta lo que mide P, que apenas baja si casi todo falla, así que el total puede acercarse
+        # a n * max_depth. Con max_work se limita: si lo que queda por recorrer puede pasarse devuelve None.
+        # Las tablas de páginas quedan con las páginas de los max_depth primeros niveles (el marco es el nivel)
+        #
+        n = len(r)
+        depths = np.full(n, max_depth + 1, dtype=np.int64)
+        self._vpage_frame.fill(-1)
+        if not n or max_depth < 1:
+            return depths
+        prv, nxt = self.prev_next_use(r)
+        times = np.arange(n)
+
+        if algo == PageAlgorithm.LRU:
+            prio = times
+            key = prv  # Prioridad con la que está en la pila la página de cada referencia
+            empty = -2
+        else:
+            prio = np.where(nxt == n, n + times, nxt)  # Las que no se vuelven a usar, en orden de último uso
+            key = times
+            empty = 2 * n + 1
+            big = 4 * n + 4
+            idx_of = np.full(n + 1, -1, dtype=np.int64)
+
+        # Nivel 1: la cima es siempre la última página referenciada
+        hit = prio[:-1] == key[1:]
+        depths[1:][hit] = 1
+        stack = [int(prio[-1])]
+        P = np.flatnonzero(~hit) + 1
+        V = prio[P - 1]
+        k = 2
+        work = 0
+
+        while len(P) and k <= max_depth:
+            if max_work is not None and work + len(P) * (max_depth - k + 1) > max_work:
+                return None
+            work += len(P)
+            if algo == PageAlgorithm.LRU:
+                level = V
+            else:
+                # La página del nivel solo cambia por otra que se use antes o cuando se usa (acierto).
+                # Tras un acierto en P[i], el siguiente es el mínimo de V[i:]; entre aciertos el nivel es el mínimo acumulado
+                idx_of[P] = np.arange(len(P))
+                jump = idx_of[np.minimum(np.minimum.accumulate(V[::-1])[::-1], n)]
+                idx_of[P] = -1
+                hit = np.zeros(len(P), dtype=bool)
+                i = jump.item(0)
+                while i >= 0:
+                    hit[i] = True
+                    i = jump.item(i)
+                seg = np.cumsum(hit) * big
+                level = np.minimum.accumulate(V - seg) + seg
+            S = np.empty(len(P), dtype=np.int64)
+            S[0] = empty
+            S[1:] = level[:-1]
+            if algo == PageAlgorithm.LRU:
+                hit = S == key[P]
+
+            depths[P[hit]] = k
+            stack.append(int(level[-1]))
+            keep = ~hit & (S != empty)
+            V = S[keep] if algo == PageAlgorithm.LRU else np.maximum(S, V)[keep]
+            P = P[keep]
+            k += 1
+
+        for frame, value in enumerate(stack):
+            self._vpage_frame[r[value] if value < n else r[value - n]] = frame
+        return depths
+
+    def replay_faults(self, r: np.ndarray, algo: PageAlgorithm, frames_amt: int):
+        #
+        # Posiciones de los fallos simulando el algoritmo con un número de marcos concreto. Se usa para
+        # FIFO y CLOCK, que no son algoritmos de pila, y para OPT cuando recorrer su pila sale caro.
+        # Mientras los fallos son frecuentes no hay nada que agrupar: se recorre la cadena referencia a
+        # referencia con un bucle sobre listas, sin llamadas a numpy, y el coste es el de una simulación
+        # directa. Cuando escasean se busca el siguiente fallo con una sola operación sobre un bloque de
+        # referencias (sin fallos las páginas cargadas no cambian) y los aciertos del bloque se aplican de golpe.
+        # OPT guarda en un montículo el próximo uso de cada página cargada y expulsa la que tarde más
+        #
+        vpage_frame = [-1] * len(self._vpage_frame)
+        bits = [0] * len(self._vpage_frame)
+        frame_vpage = [-1] * frames_amt
+        clock = algo == PageAlgorithm.CLOCK
+        opt = algo == PageAlgorithm.OPT
+        pages_amt = len(self._vpage_frame)
+        faults = []
+        resident = None  # Máscara de páginas cargadas mientras se busca por bloques
+        loaded = 0
+        hand = 0
+        batch = self.MIN_BATCH
+        i = 0
+
+        if opt:
+            # Entradas -(próximo uso * páginas + página); las de páginas usadas después de meterlas sobran y se limpian de vez en cuando
+            next_use = self.prev_next_use(r)[1]
+            keys = next_use * pages_amt + r
+            nxt = next_use.tolist()
+            heap = []
+
+        while i < len(r):
+            if resident is None:
+                j = min(i + self.DENSE_BLOCK, len(r))
+            else:
+                j = min(i + batch, len(r))
+                miss = ~resident[r[i:j]]
+                first = int(miss.argmax())
+                end = i + first if miss[first] else j
+                if clock and end > i:
+                    for vpage in np.unique(r[i:end]).tolist():
+                        bits[vpage] = 1
+                if opt and end > i:
+                    for key in keys[i:end][next_use[i:end] >= end].tolist():
+                        heappush(heap, -key)
+                if end == j:
+                    i = j
+                    batch *= 2
+                    continue
+                batch = self.MIN_BATCH
+                if end - i < self.MIN_HIT_RUN:
+                    # Los fallos vuelven a ser frecuentes
+                    resident = None
+                    i = end
+                    continue
+                i = end
+                j = end + 1  # El bucle solo trata el fallo
+
+            prev_faults = len(faults)
+            evicted = -1
+            if opt and len(heap) > 2 * frames_amt + self.DENSE_BLOCK:
+                heap = [key for key in heap if key <= -i * pages_amt]
+                heapify(heap)
+            for pos, vpage in enumerate(r[i:j].tolist(), i):
+                if vpage_frame[vpage] >= 0:
+                    bits[vpage] = 1
+                    if opt:
+                        heappush(heap, -(nxt[pos] * pages_amt + vpage))
+                    continue
+                faults.append(pos)
+                if loaded < frames_amt:
+                    frame = loaded
+                    loaded += 1
+                else:
+                    if opt:
+                        # La cima es la página cargada que tarda más en volver a usarse
+                        evicted = -heappop(heap) % pages_amt
+                        frame = vpage_frame[evicted]
+                    else:
+                        if clock:
+                            # La aguja salta los marcos con bit 1 poniéndolo a 0
+                            while bits[frame_vpage[hand]]:
+                                bits[frame_vpage[hand]] = 0
+                                hand = (hand + 1) % frames_amt
+                        frame = hand
+                        hand = (hand + 1) % frames_amt
+                        evicted = frame_vpage[frame]
+                    vpage_frame[evicted] = -1
+                frame_vpage[frame] = vpage
+                vpage_frame[vpage] = frame
+                bits[vpage] = 1
+                if opt:
+                    heappush(heap, -(nxt[pos] * pages_amt + vpage))
+
+            if resident is not None:
+                resident[r[i]] = True
+                if evicted >= 0:
+                    resident[evicted] = False
+            elif (len(faults) - prev_faults) * self.MIN_HIT_RUN < j - i:
+                resident = np.array(vpage_frame) >= 0
+            i = j
+
+        self._vpage_frame[:] = vpage_frame
+        return np.array(faults, dtype=np.int64)
+
+    @staticmethod
+    def collapse_refs(refs: np.ndarray):
+        #
+        # Quita las referencias que repiten la anterior: siempre son aciertos y no cambian el estado
+        #
+        keep = np.ones(len(refs), dtype=bool)
+        np.not_equal(refs[1:], refs[:-1], out=keep[1:])
+        return refs[keep]
+
+    @staticmethod
+    def prev_next_use(refs: np.ndarray):
+        #
+        # Para cada referencia, posición de la anterior y de la siguiente referencia a la misma
+        # página (-1 y len(refs) si no hay)
+        #
+        order = np.argsort(refs.astype(np.min_scalar_type(refs.max())), kind="stable")
+        same = refs[order[1:]] == refs[order[:-1]]
+        prv = np.full(len(refs), -1, dtype=np.int64)
+        nxt = np.full(len(refs), len(refs), dtype=np.int64)
+        prv[order[1:][same]] = order[:-1][same]
+        nxt[order[:-1][same]] = order[1:][same]
+        return prv, nxt
+
+
 class AppManager(Tk):
     #
     # Aplicación central. Maneja la interfaz de usuario y la simulación
@@ -333,6 +838,7 @@ class AppManager(Tk):
         ## Control vars ##
         # Constants #
         self.INPUT_FILENAME = "procesos.txt"
+        self.REFS_FILENAME = "referencias.txt"
         self.MIN_PROCESSES_AMOUNT = 3
         self.MIN_MEMORY_VALUE = 100
 
@@ -342,6 +848,8 @@ class AppManager(Tk):
         self._simulation = Simulation()
         self._ckbtn_instant_sim_value = BooleanVar()
         self._ckbtn_export_value = BooleanVar()
+        self._ckbtn_refs_fl_value = BooleanVar()
+        self._paging_running = False
 
         ## Widgets (UI) ##
         # Layout #
@@ -356,14 +864,17 @@ class AppManager(Tk):
         self._btn_start = Button(self._frm_inputs, text="Iniciar", command=self.run_sim)
         self._btn_pause = Button(self._frm_inputs, text="Pausar", command=self.pause_sim)
         self._btn_stop = Button(self._frm_inputs, text="Detener", command=self.stop_sim)
+        self._btn_paging = Button(self._frm_inputs, text="Paginación", command=self.run_paging)
         self._btn_clr_log = Button(self._frm_inputs, text="Limpiar", command=self.clr_log)
         self._btn_clr_prcs_list = Button(self._frm_prcs_list, text="Vaciar", command=self.clr_prcs_list)
         self._btn_rand_prcs_list = Button(self._frm_prcs_list, text="Aleatorio", command=self.make_rand_prcs)
         self._btn_read_prcs_list = Button(self._frm_prcs_list, text="Importar procesos", command=self.read_prcs_from_fl)
         self._sli_iter_sec = Scale(self._frm_inputs, label="Instantes/seg", from_=1, to=10, orient=HORIZONTAL)
+        self._sli_frames_amt = Scale(self._frm_inputs, label="Marcos", from_=1, to=PagingSimulation.FRAMES_AMT, orient=HORIZONTAL)
         self._sli_prcs_amount = Scale(self._frm_prcs_list, label="Núm. procesos", from_=self.MIN_PROCESSES_AMOUNT, to=500, sliderlength=10, orient=HORIZONTAL)
         self._ckbtn_instant_sim = Checkbutton(self._frm_inputs, text="Simulación rápida", variable=self._ckbtn_instant_sim_value, onvalue=True, offvalue=False)
         self._ckbtn_export = Checkbutton(self._frm_inputs, text="Exportar al acabar", variable=self._ckbtn_export_value, onvalue=True, offvalue=False)
+        self._ckbtn_refs_fl = Checkbutton(self._frm_inputs, text="Referencias de archivo", variable=self._ckbtn_refs_fl_value, onvalue=True, offvalue=False)
 
         # Data displays #
         self._mem_canvas = MemoryCanvas()
@@ -394,11 +905,13 @@ class AppManager(Tk):
         self._btn_start.config(state=DISABLED)
         self._btn_pause.config(state=DISABLED)
         self._btn_stop.config(state=DISABLED)
+        self._btn_paging.config(state=DISABLED)
 
         self._log.tag_configure("red", foreground="red")
         self._log.tag_configure("green", foreground="green")
 
         self._sli_prcs_amount.set(30)
+        self._sli_frames_amt.set(PagingSimulation.FRAMES_AMT)
 
         ## Layout ##
         # Main grid #
@@ -423,6 +936,9 @@ class AppManager(Tk):
         self._sli_iter_sec.grid(row=2, column=1, sticky=W, rowspan=2)
         self._ckbtn_instant_sim.grid(row=2, column=2, sticky=W, columnspan=1)
         self._ckbtn_export.grid(row=3, column=2, sticky=W)
+        self._btn_paging.grid(row=0, column=3, sticky=W)
+        self._ckbtn_refs_fl.grid(row=1, column=3, sticky=W)
+        self._sli_frames_amt.grid(row=2, column=3, sticky=W, rowspan=2)
 
         # Processes list grid #
         self._frm_prcs_list.columnconfigure(1, weight=3)
@@ -495,7 +1011,7 @@ class AppManager(Tk):
         self._log.config(state=DISABLED)
 
     def is_sim_ready_to_run(self):
-        return len(self._processes) >= self.MIN_PROCESSES_AMOUNT and self._simulation.is_idle()
+        return len(self._processes) >= self.MIN_PROCESSES_AMOUNT and self._simulation.is_idle() and not self._paging_running
 
     def clr_prcs_list(self):
         #
@@ -568,6 +1084,43 @@ class AppManager(Tk):
             self._simulation = Simulation()
             self.update_ui()
 
+    def run_paging(self):
+        #
+        # Hilo que ejecuta la simulación paginada
+        # Atajo: Ctrl+p
+        #
+        if self._btn_paging["state"] == "disabled" or self._paging_running:
+            return
+        self._paging_running = True
+        self.update_ui()
+        paging_handl_thread = Thread(target=self.handle_paging, daemon=True)
+        paging_handl_thread.start()
+
+    def handle_paging(self):
+        #
+        # Simula la memoria paginada con los procesos de la lista y muestra la tasa de fallos
+        # de cada algoritmo de reemplazo sobre la misma cadena de referencias, en total y por proceso
+        #
+        try:
+            paging = PagingSimulation(list(self._processes), self._sli_frames_amt.get())
+            if self._ckbtn_refs_fl_value.get():
+                paging.read_refs_from_fl(self.REFS_FILENAME)
+            else:
+                paging.make_rand_refs()
+            self.print(f"Paginación: {paging.get_refs_amt()} referencias · {paging.get_frames_amt()} marcos de {PagingSimulation.PAGE_SIZE}")
+            results = paging.run_all()
+            for result in results:
+                self.print(f"     {result.get_algo().name} · Fallos => {result.get_faults()} ({result.get_fault_rate():.2%})")
+            for idx, table in enumerate(paging.get_page_tables()):
+                if results[0].get_prcs_refs()[idx]:
+                    self.print(f"     {table.get_prcs().get_name()} · {results[0].get_prcs_refs()[idx]} referencias => " +
+                               " · ".join(f"{result.get_algo().name} {result.get_prcs_faults()[idx]} ({result.get_prcs_fault_rate(idx):.2%})" for result in results))
+        except (AppException, OSError):
+            self.print("Error al cargar las referencias", "red")
+        finally:
+            self._paging_running = False
+            self.update_ui()
+
     def pause_sim(self):
         #
         # Pausa la simulación
@@ -607,18 +1160,24 @@ class AppManager(Tk):
             self._sli_iter_sec.config(state=DISABLED)
             self._ckbtn_instant_sim.config(state=DISABLED)
             self._ckbtn_export.config(state=DISABLED)
+            self._btn_paging.config(state=DISABLED)
+            self._ckbtn_refs_fl.config(state=DISABLED)
+            self._sli_frames_amt.config(state=DISABLED)
         elif self._simulation.is_idle():
             self._btn_stop.config(state=DISABLED)
             self._btn_pause.config(state=DISABLED, text="Pausar")
             self._btn_read_prcs_list.config(state=NORMAL)
             self._btn_clr_prcs_list.config(state=NORMAL)
             self._btn_rand_prcs_list.config(state=NORMAL)
-            self._btn_start.config(state=NORMAL) if len(self._processes) else self._btn_start.config(state=DISABLED)
+            self._btn_start.config(state=NORMAL) if len(self._processes) and not self._paging_running else self._btn_start.config(state=DISABLED)
             self._algo_sel_1.config(state=NORMAL)
             self._algo_sel_2.config(state=NORMAL)
             self._sli_iter_sec.config(state=NORMAL)
             self._ckbtn_instant_sim.config(state=NORMAL)
             self._ckbtn_export.config(state=NORMAL)
+            self._btn_paging.config(state=NORMAL) if len(self._processes) and not self._paging_running else self._btn_paging.config(state=DISABLED)
+            self._ckbtn_refs_fl.config(state=NORMAL)
+            self._sli_frames_amt.config(state=NORMAL)
         elif self._simulation.is_paused():
             self._btn_start.config(state=DISABLED)
             self._btn_stop.config(state=NORMAL)
@@ -631,6 +1190,9 @@ class AppManager(Tk):
             self._sli_iter_sec.config(state=NORMAL)
             self._ckbtn_instant_sim.config(state=DISABLED)
             self._ckbtn_export.config(state=DISABLED)
+            self._btn_paging.config(state=DISABLED)
+            self._ckbtn_refs_fl.config(state=DISABLED)
+            self._sli_frames_amt.config(state=DISABLED)
 
 
 def set_hotkeys(app: AppManager):
@@ -641,6 +1203,7 @@ def set_hotkeys(app: AppManager):
     app.bind("<Control-q>", lambda event: app.destroy())  # Salir
     app.bind("<Control-a>", lambda event: app.make_rand_prcs())  # Llenar tabla con procesos aleatorios
     app.bind("<Control-l>", lambda event: app.clr_log())  # Limpiar el registro
+    app.bind("<Control-p>", lambda event: app.run_paging())  # Simulación paginada
     app.bind("<Control-L>", lambda event: app.clr_prcs_list())  # Limpiar el listado de procesos (Ctrl+shift+l)
     app.bind("<Return>", lambda event: app.run_sim() if app.is_sim_ready_to_run() else app.stop_sim() if app._simulation is not None else None)  # Iniciar / Detener simulación
 
@@ -0,0 +1,224 @@
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pytest
+
+from gestormemoria import AppException, PageAlgorithm, PagingSimulation, Process
+
+
+def naive_faults(refs: list, frames_amt: int, algo: PageAlgorithm):
+    #
+    # Simulación directa, referencia a referencia, para comparar
+    #
+    frames = []
+    last_use = {}
+    bits = {}
+    hand = 0
+    faults = 0
+
+    for t, vpage in enumerate(refs):
+        if vpage in frames:
+            last_use[vpage] = t
+            bits[vpage] = 1
+            continue
+        faults += 1
+        if len(frames) < frames_amt:
+            frames.append(vpage)
+        else:
+            if algo == PageAlgorithm.FIFO:
+                frame = hand
+                hand = (hand + 1) % frames_amt
+            elif algo == PageAlgorithm.LRU:
+                frame = min(range(frames_amt), key=lambda f: last_use[frames[f]])
+            elif algo == PageAlgorithm.CLOCK:
+                while bits[frames[hand]]:
+                    bits[frames[hand]] = 0
+                    hand = (hand + 1) % frames_amt
+                frame = hand
+                hand = (hand + 1) % frames_amt
+            else:
+                future = refs[t + 1:]
+                frame = max(range(frames_amt), key=lambda f: future.index(frames[f]) if frames[f] in future else len(refs))
+            frames[frame] = vpage
+        last_use[vpage] = t
+        bits[vpage] = 1
+    return faults
+
+
+def make_sim(frames_amt: int):
+    return PagingSimulation([Process("A", 1, 300, 2), Process("B", 2, 100, 2), Process("C", 30, 450, 4), Process("D", 50, 2000, 5)], frames_amt)
+
+
+@pytest.mark.parametrize("seed", range(60))
+def test_matches_naive(seed):
+    rng = np.random.default_rng(seed)
+    sim = make_sim(int(rng.integers(1, 8)))
+    refs = rng.integers(0, int(rng.integers(1, 30)), int(rng.integers(1, 200)))
+    if seed % 2:
+        refs = np.repeat(refs, rng.integers(1, 4, len(refs)))
+    sim.set_refs(refs)
+
+    for algo in PageAlgorithm:
+        assert sim.run(algo).get_faults() == naive_faults(refs.tolist(), sim.get_frames_amt(), algo)
+        for result in sim.run_all_frames(algo):
+            assert result.get_faults() == naive_faults(refs.tolist(), result.get_frames_amt(), algo)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_naive_without_stack_walk(monkeypatch, seed):
+    # Sin presupuesto para recorrer la pila: LRU cuenta distancias y OPT se simula
+    monkeypatch.setattr(PagingSimulation, "STACK_MAX_WORK", 0)
+    rng = np.random.default_rng(seed)
+    sim = make_sim(int(rng.integers(1, 8)))
+    refs = rng.integers(0, int(rng.integers(1, 30)), int(rng.integers(1, 200)))
+    sim.set_refs(refs)
+
+    for algo in PageAlgorithm:
+        assert sim.run(algo).get_faults() == naive_faults(refs.tolist(), sim.get_frames_amt(), algo)
+        for result in sim.run_all_frames(algo):
+            assert result.get_faults() == naive_faults(refs.tolist(), result.get_frames_amt(), algo)
+
+
+def test_many_frames():
+    # Con muchos marcos y casi todo fallos el coste no debe crecer con el número de marcos
+    refs = np.random.default_rng(0).integers(0, 4000, 200000)
+    lru = OrderedDict()
+    lru_faults = 0
+    for vpage in refs.tolist():
+        if vpage in lru:
+            lru.move_to_end(vpage)
+            continue
+        lru_faults += 1
+        lru[vpage] = None
+        if len(lru) > 2000:
+            lru.popitem(last=False)
+    elapsed = {}
+
+    for frames_amt in (16, 2000):
+        sim = PagingSimulation([Process(f"p{idx}", 0, 40000, 1) for idx in range(10)], frames_amt)
+        sim.set_refs(refs)
+        for algo in PageAlgorithm:
+            start = time.perf_counter()
+            result = sim.run(algo)
+            elapsed[algo, frames_amt] = time.perf_counter() - start
+            if frames_amt == 2000 and algo == PageAlgorithm.LRU:
+                assert result.get_faults() == lru_faults
+    for algo in PageAlgorithm:
+        assert elapsed[algo, 2000] < 5 * elapsed[algo, 16] + 1.0
+
+
+def test_opt_many_frames():
+    rng = np.random.default_rng(1)
+    sim = PagingSimulation([Process(f"p{idx}", 0, 10000, 1) for idx in range(4)], 150)
+    sim.set_refs(rng.integers(0, 400, 20000))
+    r = sim.collapse_refs(sim.get_refs())
+
+    assert sim.stack_depths(r, PageAlgorithm.OPT, 150, PagingSimulation.STACK_MAX_WORK * len(r)) is None
+    assert sim.run(PageAlgorithm.OPT).get_faults() == np.count_nonzero(sim.stack_depths(r, PageAlgorithm.OPT, 150) > 150)
+
+
+def test_invalid_frames_amt():
+    with pytest.raises(AppException):
+        make_sim(0)
+
+
+def test_matches_naive_with_locality():
+    # Cadena larga con pocos fallos: FIFO y CLOCK pasan a buscar los fallos por bloques
+    rng = np.random.default_rng(0)
+    refs = np.repeat(np.cumsum(rng.integers(-1, 2, 300)) % 8, 40)
+    refs[::97] = rng.integers(8, 29, len(refs[::97]))
+    sim = make_sim(6)
+    sim.set_refs(refs)
+
+    for algo in PageAlgorithm:
+        assert sim.run(algo).get_faults() == naive_faults(refs.tolist(), 6, algo)
+
+
+def test_empty_refs():
+    sim = make_sim(4)
+
+    for result in sim.run_all():
+        assert result.get_refs_amt() == 0
+        assert result.get_faults() == 0
+        assert result.get_fault_rate() == 0.0
+    assert (sim.get_page_tables()[0].get_frames() == -1).all()
+
+
+def test_one_frame():
+    sim = make_sim(1)
+    sim.set_refs([0, 0, 1, 0, 1, 1, 2])
+
+    for algo in PageAlgorithm:
+        assert sim.run(algo).get_faults() == 5
+
+
+def test_prcs_fault_rates():
+    sim = make_sim(3)
+    sim.make_rand_refs(refs_per_inst=50, seed=1)
+    tables = sim.get_page_tables()
+
+    for result in sim.run_all():
+        assert sum(result.get_prcs_refs()) == sim.get_refs_amt()
+        assert sum(result.get_prcs_faults()) == result.get_faults()
+        for idx, table in enumerate(tables):
+            assert result.get_prcs_refs()[idx] == table.get_prcs().get_duration() * 50
+            assert result.get_prcs_fault_rate(idx) == result.get_prcs_faults()[idx] / result.get_prcs_refs()[idx]
+
+
+def test_page_tables():
+    sim = make_sim(4)
+    sim.make_rand_refs(refs_per_inst=30, seed=2)
+    last = sim.get_refs()[-1]
+
+    for algo in PageAlgorithm:
+        sim.run(algo)
+        frames = np.concatenate([table.get_frames() for table in sim.get_page_tables()])
+        loaded = frames[frames >= 0]
+        assert len(loaded) == 4
+        assert sorted(loaded.tolist()) == [0, 1, 2, 3]
+        assert frames[last] >= 0
+
+
+def test_read_refs_from_fl(tmp_path):
+    refs_fl = tmp_path / "referencias.txt"
+    refs_fl.write_text("# comentario\nA 0\nB 0\n\n  # nota\nA 2\nD 19\n")
+    sim = make_sim(2)
+    sim.read_refs_from_fl(str(refs_fl))
+
+    assert sim.get_refs().tolist() == [0, 3, 2, 28]
+    assert sim.run(PageAlgorithm.FIFO).get_prcs_refs() == [2, 1, 0, 1]
+
+
+@pytest.mark.parametrize("line", ["A 3", "A -1", "A ²", "A x", "A 99999999999999999999999", "E 0", "A 0 1", "A"])
+def test_read_refs_from_fl_errors(tmp_path, line):
+    refs_fl = tmp_path / "referencias.txt"
+    refs_fl.write_text("A 0\n" + line + "\n")
+
+    with pytest.raises(AppException):
+        make_sim(2).read_refs_from_fl(str(refs_fl))
+
+
+def test_read_refs_from_fl_not_utf8(tmp_path):
+    refs_fl = tmp_path / "referencias.txt"
+    refs_fl.write_bytes(b"A 0\n\xff\xfe 1\n")
+
+    with pytest.raises(AppException):
+        make_sim(2).read_refs_from_fl(str(refs_fl))
+
+
+def test_duplicate_prcs_names(tmp_path):
+    sim = PagingSimulation([Process("A", 1, 300, 2), Process("A", 2, 200, 2), Process("B", 3, 100, 2)], 3)
+    sim.set_refs([0, 3, 4, 0, 5])
+    result = sim.run(PageAlgorithm.LRU)
+
+    assert result.get_prcs_refs() == [2, 2, 1]
+    assert result.get_prcs_faults() == [1, 2, 1]
+
+    refs_fl = tmp_path / "referencias.txt"
+    refs_fl.write_text("B 0\n")
+    sim.read_refs_from_fl(str(refs_fl))
+    assert sim.get_refs().tolist() == [5]
+    refs_fl.write_text("A 0\n")
+    with pytest.raises(AppException):
+        sim.read_refs_from_fl(str(refs_fl))